@@ -45,11 +45,11 @@ def default(self: Producer, events: ak.Array, **kwargs) -> ak.Array:
     events = self[category_ids](events, **kwargs)
 
     events = set_ak_column(events, "ht", ak.sum(events.Jet.pt, axis=1), value_type=np.float32)
-    events = set_ak_column(events, "n_jet", ak.sum(events.Jet.pt > 0, axis=1))
+    events = set_ak_column(events, "n_jet", ak.sum(events.Jet.pt > 0, axis=1), value_type=np.int32)
     events = set_ak_column(events, "n_bjet", ak.sum(events.Jet.btagDeepFlavB >=
-                           self.config_inst.x.btag_working_points.deepjet.medium, axis=1))
-    events = set_ak_column(events, "n_electron", ak.sum(events.Electron.pt > 0, axis=1))
-    events = set_ak_column(events, "n_muon", ak.sum(events.Muon.pt > 0, axis=1))
+                           self.config_inst.x.btag_working_points.deepjet.medium, axis=1), value_type=np.int32)
+    events = set_ak_column(events, "n_electron", ak.sum(events.Electron.pt > 0, axis=1), value_type=np.int32)
+    events = set_ak_column(events, "n_muon", ak.sum(events.Muon.pt > 0, axis=1), value_type=np.int32)
 
     return events
 
@@ -53,23 +53,22 @@ def normalized_weight_factory(
         if not_reproduced := missing_weights.difference(events.fields):
             logger.info(f"Weight columns {not_reproduced} could not be reproduced")
 
-
-        for weight_name in self.weight_names.intersection(events.fields):
-            # create a weight vector starting with ones
-            norm_weight_per_pid = np.ones(len(events), dtype=np.float32)
-
-            # fill weights with a new mask per unique process id (mostly just one)
-            for pid in self.unique_process_ids:
-                pid_mask = events.process_id == pid
-                norm_weight_per_pid[pid_mask] = self.ratio_per_pid[weight_name][pid]
-
-            # multiply with actual weight
-            norm_weight_per_pid = norm_weight_per_pid * events[weight_name]
+        weight_names = self.weight_names.intersection(events.fields)
+        if weight_names:
+            # position of each event's process id in the ratio lookup tables, shared by all weights;
+            # unknown process ids point to the trailing entry with a ratio of one
+            process_id = ak.to_numpy(events.process_id)
+            pid_idx = np.searchsorted(self.unique_process_ids, process_id)
+            known = pid_idx < len(self.unique_process_ids)
+            known[known] = self.unique_process_ids[pid_idx[known]] == process_id[known]
+            pid_idx[~known] = len(self.unique_process_ids)
+
+        for weight_name in weight_names:
+            # look up the ratio per event and multiply with actual weight
+            norm_weight_per_pid = self.ratio_lookup[weight_name][pid_idx] * ak.to_numpy(events[weight_name])
 
             # store it
-            norm_weight_per_pid = ak.values_astype(norm_weight_per_pid, np.float32)
-            events = set_ak_column(events, f"normalized_{weight_name}", norm_weight_per_pid)
-
+            events = set_ak_column(events, f"normalized_{weight_name}", norm_weight_per_pid, value_type=np.float32)
 
         return events
 
@@ -101,9 +100,9 @@ def normalized_weight_factory(
         # load the selection stats
         stats = inputs["selection_stats"]["collection"][0]["stats"].load(formatter="json")
 
-        # get the unique process ids in that dataset
+        # get the unique process ids in that dataset, sorted for lookups
         key = "sum_mc_weight_per_process"
-        self.unique_process_ids = list(map(int, stats[key].keys()))
+        self.unique_process_ids = np.array(sorted(map(int, stats[key].keys())), dtype=np.int64)
 
         # helper to get numerators and denominators
         def numerator_per_pid(pid):
@@ -123,4 +122,10 @@ def normalized_weight_factory(
             for weight_name in self.weight_names
         }
 
-    return normalized_weight
\ No newline at end of file
+        # lookup tables aligned with the sorted process ids, with a trailing one for unknown ids
+        self.ratio_lookup = {
+            weight_name: np.array(list(ratios.values()) + [1.0], dtype=np.float32)
+            for weight_name, ratios in self.ratio_per_pid.items()
+        }
+
+    return normalized_weight
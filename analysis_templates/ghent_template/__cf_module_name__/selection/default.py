@@ -35,11 +35,19 @@ maybe_import("coffea.nanoevents.methods.nanoaod")
 logger = law.logger.get_logger(__name__)
 
 
-def TetraVec(arr: ak.Array) -> ak.Array:
-    TetraVec = ak.zip({"pt": arr.pt, "eta": arr.eta, "phi": arr.phi, "mass": arr.mass},
-    with_name="PtEtaPhiMLorentzVector",
-    behavior=coffea.nanoevents.methods.vector.behavior)
-    return TetraVec
+def pair_mass(obj1: ak.Array, obj2: ak.Array) -> ak.Array:
+    """
+    Invariant mass of two objects with pt, eta, phi and mass fields, computed directly from their
+    components instead of building and adding two Lorentz vector records.
+    """
+    px = obj1.pt * np.cos(obj1.phi) + obj2.pt * np.cos(obj2.phi)
+    py = obj1.pt * np.sin(obj1.phi) + obj2.pt * np.sin(obj2.phi)
+    pz = obj1.pt * np.sinh(obj1.eta) + obj2.pt * np.sinh(obj2.eta)
+    e = (
+        np.sqrt((obj1.pt * np.cosh(obj1.eta)) ** 2 + obj1.mass ** 2) +
+        np.sqrt((obj2.pt * np.cosh(obj2.eta)) ** 2 + obj2.mass ** 2)
+    )
+    return np.sqrt(np.maximum(e ** 2 - px ** 2 - py ** 2 - pz ** 2, 0))
 
 
 @selector(
@@ -67,7 +75,7 @@ def pre_selection(
     events = self[attach_coffea_behavior](events, **kwargs)
 
     results = SelectionResult()
-    results.event = ~events.veto if has_ak_column(events, "veto") else ak.full_like(events.mc_weight, True, dtype=bool)
+    results.event = ~events.veto if has_ak_column(events, "veto") else np.ones(len(events), dtype=bool)
     return events, results
 
 
@@ -101,7 +109,7 @@ def lepton_selection(
     lepton = ak.fill_none(ak.pad_none(lepton, 2, axis=-1), fill_with)
 
     # construct the Z-boson candidate mask
-    mll = (TetraVec(lepton[:, 0]) + TetraVec(lepton[:, 1])).mass
+    mll = pair_mass(lepton[:, 0], lepton[:, 1])
     z_mask = (
         (lepton[:, 0].charge != lepton[:, 1].charge) &
         (abs(lepton[:, 0].pdgId) == abs(lepton[:, 1].pdgId)) &
@@ -140,9 +148,11 @@ def jet_selection(
     **kwargs,
 ) -> Tuple[ak.Array, SelectionResult]:
 
-    jet = (events.Jet[results.objects.Jet.Jet])
-
-    bjet_mask_medium = (jet.btagDeepFlavB >= self.config_inst.x.btag_working_points.deepjet.medium)
+    # reuse the jet mask of the object selection rather than gathering the selected jets again
+    bjet_mask_medium = (
+        results.x.jet_mask &
+        (events.Jet.btagDeepFlavB >= self.config_inst.x.btag_working_points.deepjet.medium)
+    )
 
     jet_event_mask = (ak.sum(bjet_mask_medium, axis=-1) >= 1)
 
@@ -7,31 +7,61 @@ Helpers and utilities for working with columnar libraries (Ghent cms group)
 from __future__ import annotations
 
 __all__ = [
-    "TetraVec", "safe_concatenate",
+    "TetraVec", "get_vector_behavior", "safe_concatenate",
 ]
 
 from columnflow.util import maybe_import
 
 ak = maybe_import("awkward")
-coffea = maybe_import("coffea")
+
+
+# fields required to build a Lorentz vector in TetraVec
+_tetra_vec_fields = ("pt", "eta", "phi", "mass")
+
+
+_vector_behavior = None
+
+
+def get_vector_behavior() -> dict:
+    """
+    Lazily imports and caches the coffea vector behavior used to build Lorentz vectors.
+    """
+    global _vector_behavior
+
+    if _vector_behavior is None:
+        from coffea.nanoevents.methods import vector
+
+        _vector_behavior = vector.behavior
+
+    return _vector_behavior
 
 
 def TetraVec(arr: ak.Array) -> ak.Array:
     """
     create a Lorentz for fector from an awkward array with pt, eta, phi, and mass fields
     """
-    for field in ["pt", "eta", "phi", "mass"]:
-        assert hasattr(arr, field), f"Provided array is missing {field} field"
-    TetraVec = ak.zip({"pt": arr.pt, "eta": arr.eta, "phi": arr.phi, "mass": arr.mass},
+    # attribute access also covers components provided as properties by a behavior
+    missing_fields = [field for field in _tetra_vec_fields if not hasattr(arr, field)]
+    assert not missing_fields, f"Provided array is missing {', '.join(missing_fields)} field(s)"
+    TetraVec = ak.zip({field: getattr(arr, field) for field in _tetra_vec_fields},
     with_name="PtEtaPhiMLorentzVector",
-    behavior=coffea.nanoevents.methods.vector.behavior)
+    behavior=get_vector_behavior())
     return TetraVec
 
 
 def safe_concatenate(arrays, *args, **kwargs):
-    n = len(arrays)
-    if n > 2 ** 7:
-        c1 = safe_concatenate(arrays[:n // 2], *args, **kwargs)
-        c2 = safe_concatenate(arrays[n // 2:], *args, **kwargs)
-        return ak.concatenate([c1, c2], *args, **kwargs)
+    """
+    Concatenates a potentially large number of awkward *arrays* via :py:func:`ak.concatenate` while
+    passing at most 128 arrays per call. Arrays are concatenated in consecutive batches whose
+    results are again concatenated in batches until a single array remains, so that each
+    element is copied only once per level. *args* and *kwargs* are forwarded to
+    :py:func:`ak.concatenate`.
+    """
+    batch_size = 2 ** 7
+    arrays = list(arrays)
+    while len(arrays) > batch_size:
+        arrays = [
+            ak.concatenate(arrays[i:i + batch_size], *args, **kwargs)
+            for i in range(0, len(arrays), batch_size)
+        ]
     return ak.concatenate(arrays, *args, **kwargs)
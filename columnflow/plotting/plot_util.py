@@ -545,8 +545,6 @@ def get_profile_width(h_in: hist.Hist, axis: int = 1) -> tuple[np.array, np.arra
     num = np.sum(values * centers, axis=axis)
     den = np.sum(values, axis=axis)
 
-    print(num.shape)
-
     with np.errstate(invalid="ignore"):
         mean = num / den
         _mean = broadcast_nminus1d_to_nd(mean, values.shape, axis)
@@ -613,31 +611,29 @@ def prepare_plot_config_2d(
     if shape_norm:
         h_sum = h_sum / h_sum.sum().value
 
-    # mask bins without any entries (variance == 0)
+    # mask bins without any entries (variance == 0), writing to the storage view in place
     h_view = h_sum.view()
-    h_view.value[h_view.variance == 0] = np.nan
+    values = h_view.value
+    values[h_view.variance == 0] = np.nan
 
-    # check h_sum value range
-    vmin, vmax = np.nanmin(h_sum.values()), np.nanmax(h_sum.values())
-    vmin, vmax = np.nan_to_num([vmin, vmax], 0)
+    # check h_sum value range, scanning the values only once
+    extrema = np.array([np.nanmin(values), np.nanmax(values)])
+    vmin, vmax = np.nan_to_num(extrema, 0)
 
     # default to full z range
     if zlim is None:
         zlim = ("min", "max")
 
-    # resolve string specifiers like "min", "max", etc.
-    zlim = tuple(reduce_with(lim, h_sum.values()) for lim in zlim)
+    # resolve string specifiers like "min", "max", etc.; these only depend on the extrema, so only
+    # callables need to see the full values again
+    zlim = tuple(reduce_with(lim, values if callable(lim) else extrema) for lim in zlim)
 
     # if requested, hide or clip bins outside specified plot range
+    # (values is a view into the h_sum storage, so no write-back is needed)
     if extremes == "hide":
-        h_view.value[h_view.value < zlim[0]] = np.nan
-        h_view.value[h_view.value > zlim[1]] = np.nan
+        values[(values < zlim[0]) | (values > zlim[1])] = np.nan
     elif extremes == "clip":
-        h_view.value[h_view.value < zlim[0]] = zlim[0]
-        h_view.value[h_view.value > zlim[1]] = zlim[1]
-
-    # update h_sum values from view
-    h_sum[...] = h_view
+        np.clip(values, zlim[0], zlim[1], out=values)
 
     # choose appropriate colorbar normalization
     # based on scale type and h_sum content
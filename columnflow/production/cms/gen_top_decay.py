@@ -37,29 +37,31 @@ def gen_top_decay_products(self: Producer, events: ak.Array, **kwargs) -> ak.Arr
             ...
         ]
     """
-    # find hard top quarks
+    # find hard top quarks, evaluating the flags only on the few top candidates
     abs_id = abs(events.GenPart.pdgId)
     t = events.GenPart[abs_id == 6]
     t = t[t.hasFlags("isHardProcess")]
     t = t[~ak.is_none(t, axis=1)]
 
-    # distinct top quark children (b's and W's)
-    t_children = t.distinctChildrenDeep[t.distinctChildrenDeep.hasFlags("isHardProcess")]
+    # distinct top quark children (b's and W's), resolved only once as the lookup is expensive
+    t_children = t.distinctChildrenDeep
+    t_children = t_children[t_children.hasFlags("isHardProcess")]
+    abs_t_children_id = abs(t_children.pdgId)
 
     # get b's
-    b = t_children[abs(t_children.pdgId) == 5][:, :, 0]
+    b = t_children[abs_t_children_id == 5][:, :, 0]
 
     # get W's
-    w = t_children[abs(t_children.pdgId) == 24][:, :, 0]
+    w = t_children[abs_t_children_id == 24][:, :, 0]
 
     # distinct W children
-    w_children = w.distinctChildrenDeep[w.distinctChildrenDeep.hasFlags("isHardProcess")]
+    w_children = w.distinctChildrenDeep
+    w_children = w_children[w_children.hasFlags("isHardProcess")]
 
     # reorder the first two W children (leptons or quarks) so that the charged lepton / down-type
-    # quark is listed first (they have an odd pdgId)
-    w_children_firsttwo = w_children[:, :, :2]
-    w_children_firsttwo = w_children_firsttwo[(w_children_firsttwo.pdgId % 2 == 0) * 1]
-    w_children_rest = w_children[:, :, 2:]
+    # quark is listed first (they have an odd pdgId), using a single gather over all children
+    w_children_idx = ak.local_index(w_children, axis=2)
+    w_children = w_children[ak.where(w_children_idx < 2, (w_children.pdgId % 2 == 0) * 1, w_children_idx)]
 
     # concatenate to create the structure to return
     groups = ak.concatenate(
@@ -67,8 +69,7 @@ def gen_top_decay_products(self: Producer, events: ak.Array, **kwargs) -> ak.Arr
             t[:, :, None],
             b[:, :, None],
             w[:, :, None],
-            w_children_firsttwo,
-            w_children_rest,
+            w_children,
         ],
         axis=2,
     )
@@ -116,7 +116,7 @@ def pdf_weights(
     stddev = (pdf_weights[:, 83] - pdf_weights[:, 15]) / 2
 
     # store columns
-    events = set_ak_column_f32(events, "pdf_weight", ak.ones_like(events.event))
+    events = set_ak_column_f32(events, "pdf_weight", np.ones(len(events), dtype=np.float32))
     events = set_ak_column_f32(events, "pdf_weight_up", 1 + stddev)
     events = set_ak_column_f32(events, "pdf_weight_down", 1 - stddev)
 
@@ -131,10 +131,13 @@ def pdf_weights(
         )
 
         if outlier_action == "remove":
-            # set all pdf weights to 0 when the *outlier_threshold* is passed
-            events = set_ak_column_f32(events, "pdf_weight", ak.where(outlier_mask, 0, events.pdf_weight))
-            events = set_ak_column_f32(events, "pdf_weight_up", ak.where(outlier_mask, 0, events.pdf_weight_up))
-            events = set_ak_column_f32(events, "pdf_weight_down", ak.where(outlier_mask, 0, events.pdf_weight_down))
+            # set all pdf weights to 0 when the *outlier_threshold* is passed, resolving the
+            # positions of outliers only once and overwriting just those entries
+            outlier_indices = np.flatnonzero(ak.to_numpy(outlier_mask))
+            for postfix in ["", "_up", "_down"]:
+                values = np.array(ak.to_numpy(events[f"pdf_weight{postfix}"]))
+                values[outlier_indices] = 0
+                events = set_ak_column_f32(events, f"pdf_weight{postfix}", values)
 
             msg += ". The nominal/up/down pdf_weight columns have been set to 0 for these events."
         elif outlier_action == "raise":
@@ -14,6 +14,7 @@ from columnflow.columnar_util import set_ak_column
 
 np = maybe_import("numpy")
 ak = maybe_import("awkward")
+correctionlib = maybe_import("correctionlib")
 
 
 # helper
@@ -35,24 +36,22 @@ def pu_weight(self: Producer, events: ak.Array, **kwargs) -> ak.Array:
     """
     Based on the number of primary vertices, assigns each event pileup weights using correctionlib.
     """
-    # compute the indices for looking up weights
-    indices = events.Pileup.nTrueInt.to_numpy().astype("int32") - 1
+    # compute the indices for looking up weights, writing directly into an int32 buffer
+    indices = np.subtract(ak.to_numpy(events.Pileup.nTrueInt), 1, dtype=np.int32, casting="unsafe")
 
-    # map the variable names from the corrector to our columns
-    variable_map = {
-        "NumTrueInteractions": indices,
-    }
+    # build the corrector inputs once, all variations share the same indices and only differ in
+    # the variation name (correctionlib does not support vectorized string inputs, so the
+    # evaluation itself is done per variation)
+    inputs = [(indices if name == "NumTrueInteractions" else None) for name in self.pileup_input_names]
+    syst_pos = self.pileup_input_names.index("weights")
 
     for column_name, syst in (
         ("pu_weight", "nominal"),
         ("pu_weight_minbias_xs_up", "up"),
         ("pu_weight_minbias_xs_down", "down"),
     ):
-        # get the inputs for this type of variation
-        variable_map_syst = {**variable_map, "weights": syst}
-        inputs = [variable_map_syst[inp.name] for inp in self.pileup_corrector.inputs]
-
         # evaluate and store the produced column
+        inputs[syst_pos] = syst
         pu_weight = self.pileup_corrector.evaluate(*inputs)
         events = set_ak_column(events, column_name, pu_weight, value_type=np.float32)
 
@@ -85,8 +84,6 @@ def pu_weight_setup(
     bundle = reqs["external_files"]
 
     # create the corrector
-    import correctionlib
-    correctionlib.highlevel.Correction.__call__ = correctionlib.highlevel.Correction.evaluate
     correction_set = correctionlib.CorrectionSet.from_string(
         self.get_pileup_file(bundle.files).load(formatter="gzip").decode("utf-8"),
     )
@@ -97,6 +94,7 @@ def pu_weight_setup(
 
     corrector_name = list(correction_set.keys())[0]
     self.pileup_corrector = correction_set[corrector_name]
+    self.pileup_input_names = [inp.name for inp in self.pileup_corrector.inputs]
 
 
 @producer(
@@ -111,15 +109,18 @@ def pu_weights_from_columnflow(self: Producer, events: ak.Array, **kwargs) -> ak
     of pileup ratios at the py:attr:`pu_weights` attribute provided by the requires and setup
     functions below.
     """
-    # compute the indices for looking up weights
-    indices = events.Pileup.nTrueInt.to_numpy().astype("int32") - 1
-    max_bin = len(self.pu_weights) - 1
-    indices[indices > max_bin] = max_bin
+    # compute the indices for looking up weights, writing directly into an int32 buffer
+    indices = np.subtract(ak.to_numpy(events.Pileup.nTrueInt), 1, dtype=np.int32, casting="unsafe")
+    max_bin = self.pu_weights.shape[1] - 1
+    np.clip(indices, 0, max_bin, out=indices)
+
+    # look up all variations at once
+    weights = self.pu_weights[:, indices]
 
     # save the weights
-    events = set_ak_column_f32(events, "pu_weight", self.pu_weights.nominal[indices])
-    events = set_ak_column_f32(events, "pu_weight_minbias_xs_up", self.pu_weights.minbias_xs_up[indices])
-    events = set_ak_column_f32(events, "pu_weight_minbias_xs_down", self.pu_weights.minbias_xs_down[indices])
+    events = set_ak_column_f32(events, "pu_weight", weights[0])
+    events = set_ak_column_f32(events, "pu_weight_minbias_xs_up", weights[1])
+    events = set_ak_column_f32(events, "pu_weight_minbias_xs_down", weights[2])
 
     return events
 
@@ -145,6 +146,12 @@ def pu_weights_from_columnflow_setup(
 ) -> None:
     """
     Loads the pileup weights added through the requirements and saves them in the
-    py:attr:`pu_weights` attribute for simpler access in the actual callable.
+    py:attr:`pu_weights` attribute for simpler access in the actual callable. The weights are
+    stored as a single float32 array of shape (3, n_bins) with rows corresponding to the nominal,
+    minbias_xs_up and minbias_xs_down variations.
     """
-    self.pu_weights = ak.zip(inputs["pu_weights"].load(formatter="json"))
+    pu_weights = inputs["pu_weights"].load(formatter="json")
+    self.pu_weights = np.array(
+        [pu_weights[shift] for shift in ("nominal", "minbias_xs_up", "minbias_xs_down")],
+        dtype=np.float32,
+    )
@@ -141,19 +141,19 @@ def murmuf_weights(self: Producer, events: ak.Array, **kwargs) -> ak.Array:
     events = set_ak_column_f32(
         events,
         "mur_weight",
-        ak.ones_like(events.event),
+        np.ones(len(events), dtype=np.float32),
     )
     events = set_ak_column_f32(
         events,
         "muf_weight",
-        ak.ones_like(events.event),
+        np.ones(len(events), dtype=np.float32),
     )
 
     # fully correlated weights
     events = set_ak_column_f32(
         events,
         "murmuf_weight",
-        ak.ones_like(events.event),
+        np.ones(len(events), dtype=np.float32),
     )
 
     # now loop through the clear names and save the respective normalized
@@ -229,7 +229,7 @@ def murmuf_envelope_weights(self: Producer, events: ak.Array, **kwargs) -> ak.Ar
     considered_murf_weights = (events.LHEScaleWeight / murf_nominal)[:, envelope_indices]
 
     # store columns
-    events = set_ak_column_f32(events, "murf_envelope_weight", ak.ones_like(events.event))
+    events = set_ak_column_f32(events, "murf_envelope_weight", np.ones(len(events), dtype=np.float32))
     events = set_ak_column_f32(events, "murf_envelope_weight_down", ak.min(considered_murf_weights, axis=1))
     events = set_ak_column_f32(events, "murf_envelope_weight_up", ak.max(considered_murf_weights, axis=1))
 
@@ -74,6 +74,15 @@ def lepton_gen_features(
 
     genpart = events.GenPart
 
+    # select stable gen particles and split them into the candidates for geometric matching once,
+    # rather than re-masking the full collection for every lepton flavor
+    stable_genpart = genpart[genpart.status == 1]
+    gen_abs_pdgId = abs(stable_genpart.pdgId)
+    gen_candidates = {
+        abs_pdgId: stable_genpart[gen_abs_pdgId == abs_pdgId]
+        for abs_pdgId in (11, 13, 22)
+    }
+
     for name, abs_pdgId in (("Electron", 11), ("Muon", 13)):
 
         lepton = events[name]
@@ -85,15 +94,11 @@ def lepton_gen_features(
 
         # if this fails apply geometric matching to stable leptons and photons
 
-        # select stable gen particles
-        stable_genpart = genpart[genpart.status == 1]
-
         # first look for closest mathing generator lepton within cone of 0.2
-        gen_abs_pdgId = abs(stable_genpart.pdgId)
-        geom_match_lepton, lepton_within_cone = _geometric_matching(lepton, stable_genpart[gen_abs_pdgId == abs_pdgId])
+        geom_match_lepton, lepton_within_cone = _geometric_matching(lepton, gen_candidates[abs_pdgId])
 
         # if not within cone of 0.2, allow for a photon match
-        geom_match_photon, photon_within_cone = _geometric_matching(lepton, stable_genpart[gen_abs_pdgId == 22])
+        geom_match_photon, photon_within_cone = _geometric_matching(lepton, gen_candidates[22])
 
         # finally apply hierarchy to determine matched gen particle
         match = ak.Array(ak.zeros_like(geom_match_photon))
@@ -30,6 +30,6 @@ def process_ids(self: Producer, events: ak.Array, **kwargs) -> ak.Array:
     process_id = self.dataset_inst.processes.get_first().id
 
     # store the column
-    events = set_ak_column(events, "process_id", len(events) * [process_id], value_type=np.int32)
+    events = set_ak_column(events, "process_id", np.full(len(events), process_id, dtype=np.int32))
 
     return events
@@ -48,13 +48,19 @@ def veto_events(
 
     """
 
-    veto = np.full_like(events.event, False, dtype=bool)
+    # accumulate the veto mask in place on plain numpy arrays
+    veto = np.zeros(len(events), dtype=bool)
+    event, run, lumi = (ak.to_numpy(events[c]) for c in ("event", "run", "luminosityBlock"))
     for veto_event in self.veto_list:
         if file is None or "file" not in veto_event or file.path == veto_event["file"]:
-            veto = veto | (
-                (events.event == veto_event["event"]) &
-                (events.run == veto_event["run"]) &
-                (events.luminosityBlock == veto_event["luminosityBlock"])
+            np.logical_or(
+                veto,
+                (
+                    (event == veto_event["event"]) &
+                    (run == veto_event["run"]) &
+                    (lumi == veto_event["luminosityBlock"])
+                ),
+                out=veto,
             )
 
     events = set_ak_column(events, "veto", veto)
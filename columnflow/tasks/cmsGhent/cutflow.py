@@ -1,5 +1,5 @@
 
-from collections import defaultdict, OrderedDict
+from collections import defaultdict
 from scinum import Number
 
 
@@ -137,6 +137,10 @@ class CreateCutflowTable(
             proc: [sub for sub, _, _ in proc.walk_processes(include_self=True)]
             for proc in process_insts
         }
+        sub_process_names = {
+            process_inst: {sub.name for sub in subs}
+            for process_inst, subs in sub_process_insts.items()
+        }
 
         # histogram data per process
         hists = {}
@@ -144,6 +148,7 @@ class CreateCutflowTable(
         with self.publish_step(f"Creating cutflow table in {category_inst.name}"):
             for dataset, inp in inputs.items():
                 dataset_inst = self.config_inst.get_dataset(dataset)
+                dataset_process_names = {p.name for p, _, _ in dataset_inst.walk_processes()}
 
                 # load the histogram of the variable named "event"
                 h_in = inp["hists"]["event"].load(formatter="pickle")
@@ -153,26 +158,28 @@ class CreateCutflowTable(
                 if n_shifts != 1:
                     raise Exception(f"shift axis is supposed to only contain 1 bin, found {n_shifts}")
 
+                # process and category ids present in the histogram, resolved once for fast
+                # membership checks
+                h_process_ids = set(h_in.axes["process"])
+                h_category_ids = set(h_in.axes["category"])
+
                 # loop and extract one histogram per process
                 for process_inst in process_insts:
                     # skip when the dataset is already known to not contain any sub process
-                    if not any(map(dataset_inst.has_process, sub_process_insts[process_inst])):
+                    if dataset_process_names.isdisjoint(sub_process_names[process_inst]):
                         continue
 
-                    # work on a copy
-                    h = h_in.copy()
-
-                    # axis selections
-                    h = h[{
+                    # axis selections, returning a new histogram so that h_in is not modified
+                    h = h_in[{
                         "process": [
                             hist.loc(p.id)
                             for p in sub_process_insts[process_inst]
-                            if p.id in h.axes["process"]
+                            if p.id in h_process_ids
                         ],
                         "category": [
                             hist.loc(c.id)
                             for c in leaf_category_insts
-                            if c.id in h.axes["category"]
+                            if c.id in h_category_ids
                         ],
                     }]
 
@@ -190,10 +197,11 @@ class CreateCutflowTable(
                 raise Exception("no histograms found to plot")
 
             # sort hists by process order
-            hists = OrderedDict(
-                (process_inst, hists[process_inst])
-                for process_inst in sorted(hists, key=process_insts.index)
-            )
+            process_order = {process_inst: i for i, process_inst in enumerate(process_insts)}
+            hists = {
+                process_inst: hists[process_inst]
+                for process_inst in sorted(hists, key=process_order.__getitem__)
+            }
 
             yields, processes = defaultdict(list), []
 
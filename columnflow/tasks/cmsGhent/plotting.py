@@ -56,6 +56,7 @@ class PlotVariablesCatsPerProcessBase(PlotVariablesBaseSingleShift):
         category_insts = [self.config_inst.get_category(c) for c in self.branch_data.categories]
         process_inst = self.config_inst.get_process(self.branch_data.process)
         sub_process_insts = [sub for sub, _, _ in process_inst.walk_processes(include_self=True)]
+        sub_process_names = {sub.name for sub in sub_process_insts}
 
         # histogram data for process
         process_hist = 0
@@ -63,32 +64,36 @@ class PlotVariablesCatsPerProcessBase(PlotVariablesBaseSingleShift):
         with self.publish_step(f"plotting {self.branch_data.variable} for {process_inst.name}"):
             for dataset, inp in self.input().items():
                 dataset_inst = self.config_inst.get_dataset(dataset)
-                h_in = inp["collection"][0]["hists"].targets[self.branch_data.variable].load(formatter="pickle")
 
-                # extract one histogram for process
-                # skip when the dataset is already known to not contain any sub process
-                if not any(map(dataset_inst.has_process, sub_process_insts)):
+                # skip when the dataset is already known to not contain any sub process, before
+                # loading its histogram
+                if sub_process_names.isdisjoint(p.name for p, _, _ in dataset_inst.walk_processes()):
                     continue
 
-                # work on a copy
-                h = h_in.copy()
+                # extract one histogram for process
+                h_in = inp["collection"][0]["hists"].targets[self.branch_data.variable].load(formatter="pickle")
+
+                # axis ids present in the histogram, resolved once for fast membership checks
+                h_process_ids = set(h_in.axes["process"])
+                h_category_ids = set(h_in.axes["category"])
+                h_shift_ids = set(h_in.axes["shift"])
 
-                # axis selections
-                h = h[{
+                # axis selections, returning a new histogram so that h_in is not modified
+                h = h_in[{
                     "process": [
                         hist.loc(p.id)
                         for p in sub_process_insts
-                        if p.id in h.axes["process"]
+                        if p.id in h_process_ids
                     ],
                     "category": [
                         hist.loc(c.id)
                         for c in category_insts
-                        if c.id in h.axes["category"]
+                        if c.id in h_category_ids
                     ],
                     "shift": [
                         hist.loc(s.id)
                         for s in plot_shifts
-                        if s.id in h.axes["shift"]
+                        if s.id in h_shift_ids
                     ],
                 }]
 
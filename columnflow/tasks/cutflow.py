@@ -148,11 +148,15 @@ class CreateCutflowHistograms(
         # define steps
         steps = self.selector_steps
 
+        # resolve variable instances once per variable tuple
+        variable_insts_per_key = {
+            var_key: [self.config_inst.get_variable(var_name) for var_name in var_names]
+            for var_key, var_names in self.variable_tuples.items()
+        }
+
         # prepare expressions
         expressions = {}
-        for var_key, var_names in self.variable_tuples.items():
-            variable_insts = [self.config_inst.get_variable(var_name) for var_name in var_names]
-
+        for variable_insts in variable_insts_per_key.values():
             # get the expression per variable and when a string, parse it to extract index lookups
             for variable_inst in variable_insts:
                 expr = variable_inst.expression
@@ -173,9 +177,7 @@ class CreateCutflowHistograms(
         # prepare histograms
         histograms = {}
         def prepare_hists(steps):
-            for var_key, var_names in self.variable_tuples.items():
-                variable_insts = [self.config_inst.get_variable(var_name) for var_name in var_names]
-
+            for var_key, variable_insts in variable_insts_per_key.items():
                 # create histogram of not already existing
                 if var_key not in histograms:
                     h = (
@@ -237,43 +239,56 @@ class CreateCutflowHistograms(
                 missing_strategy=self.missing_column_alias_strategy,
             )
 
-            # pad the category_ids when the event is not categorized at all
-            category_ids = ak.fill_none(ak.pad_none(events.category_ids, 1, axis=-1), -1)
-
-            for var_key, var_names in self.variable_tuples.items():
-                # helper to build the point for filling, except for the step which does
-                # not support broadcasting
-                def get_point(mask=Ellipsis):
-                    n_events = len(events) if mask is Ellipsis else ak.sum(mask)
-                    point = {
-                        "process": events.process_id[mask],
-                        "category": category_ids[mask],
-                        "shift": np.ones(n_events, dtype=np.int32) * self.global_shift_inst.id,
-                        "weight": (
-                            events.normalization_weight[mask]
-                            if self.dataset_inst.is_mc
-                            else np.ones(n_events, dtype=np.float32)
-                        ),
-                    }
-                    for var_name in var_names:
-                        point[var_name] = expressions[var_name](events)[mask]
-                    return point
-
-                # fill the raw point
-                fill_data = get_point()
-                fill_hist(histograms[var_key], fill_data, fill_kwargs={"step": self.initial_step})
-
-                # fill all other steps
-                mask = True
-                for step in steps:
-                    if step not in sel.steps.fields:
-                        raise ValueError(
-                            f"step '{step}' is not defined by selector {self.selector}",
-                        )
-                    # incrementally update the mask and fill the point
+            # pad the category_ids when the event is not categorized at all, which only requires a
+            # new jagged layout when at least one event has no category
+            category_ids = events.category_ids
+            if not ak.all(ak.num(category_ids, axis=1) > 0):
+                category_ids = ak.fill_none(ak.pad_none(category_ids, 1, axis=-1), -1)
+
+            # build the cumulative step masks once per chunk, starting with the raw point
+            for step in steps:
+                if step not in sel.steps.fields:
+                    raise ValueError(
+                        f"step '{step}' is not defined by selector {self.selector}",
+                    )
+            step_masks = [(self.initial_step, Ellipsis, len(events))]
+            if steps:
+                cum_masks = np.logical_and.accumulate(
+                    np.stack([ak.to_numpy(sel.steps[step]) for step in steps]),
+                    axis=0,
+                )
+                step_masks.extend(zip(steps, cum_masks, np.count_nonzero(cum_masks, axis=1)))
+
+            # allocate the shift and weight columns once per chunk and only mask them per step
+            shift_ids = np.full(len(events), self.global_shift_inst.id, dtype=np.int32)
+            weights = (
+                events.normalization_weight
+                if self.dataset_inst.is_mc
+                else np.ones(len(events), dtype=np.float32)
+            )
 
-                    mask = mask & sel.steps[step]
-                    fill_data = get_point(mask)
+            # evaluate all variable expressions once per chunk
+            values = {var_name: expr(events) for var_name, expr in expressions.items()}
+
+            # fill all steps, visiting all variables per step so that each mask is applied while
+            # the same event columns are still hot
+            for step, mask, n_sel in step_masks:
+                # masks are cumulative, so once no event is left all remaining steps are empty
+                if n_sel == 0:
+                    break
+
+                # build the part of the point that is shared by all variables, except for the step
+                # which does not support broadcasting
+                base_point = {
+                    "process": events.process_id[mask],
+                    "category": category_ids[mask],
+                    "shift": shift_ids[:n_sel],
+                    "weight": weights[mask],
+                }
+                for var_key, var_names in self.variable_tuples.items():
+                    fill_data = dict(base_point)
+                    for var_name in var_names:
+                        fill_data[var_name] = values[var_name][mask]
                     fill_hist(histograms[var_key], fill_data, fill_kwargs={"step": step})
 
         # dump the histograms
@@ -443,6 +458,10 @@ class PlotCutflow(
             proc: [sub for sub, _, _ in proc.walk_processes(include_self=True)]
             for proc in process_insts
         }
+        sub_process_names = {
+            process_inst: {sub.name for sub in subs}
+            for process_inst, subs in sub_process_insts.items()
+        }
 
         # histogram data per process
         hists = {}
@@ -450,6 +469,7 @@ class PlotCutflow(
         with self.publish_step(f"plotting cutflow in {category_inst.name}"):
             for dataset, inp in self.input().items():
                 dataset_inst = self.config_inst.get_dataset(dataset)
+                dataset_process_names = {p.name for p, _, _ in dataset_inst.walk_processes()}
                 h_in = inp["hists"][self.variable].load(formatter="pickle")
 
                 # sanity checks
@@ -457,22 +477,21 @@ class PlotCutflow(
                 if n_shifts != 1:
                     raise Exception(f"shift axis is supposed to only contain 1 bin, found {n_shifts}")
 
+                # process ids present in the histogram, resolved once for fast membership checks
+                h_process_ids = set(h_in.axes["process"])
+
                 # loop and extract one histogram per process
                 for process_inst in process_insts:
                     # skip when the dataset is already known to not contain any sub process
-                    if not any(
-                        dataset_inst.has_process(sub_process_inst.name)
-                        for sub_process_inst in sub_process_insts[process_inst]
-                    ):
+                    if dataset_process_names.isdisjoint(sub_process_names[process_inst]):
                         continue
 
-                    # select processes and reduce axis
-                    h = h_in.copy()
-                    h = h[{
+                    # select processes and reduce axis, the selection already returns a new histogram
+                    h = h_in[{
                         "process": [
                             hist.loc(p.id)
                             for p in sub_process_insts[process_inst]
-                            if p.id in h.axes["process"]
+                            if p.id in h_process_ids
                         ],
                     }]
                     h = h[{"process": sum}]
@@ -493,8 +512,9 @@ class PlotCutflow(
             total = sum(hists.values()).values() if self.relative else np.ones((len(self.selector_steps) + 1, 1))
 
             # axis selections and reductions, including sorting by process order
-            _hists = OrderedDict()
-            for process_inst in sorted(hists, key=process_insts.index):
+            process_order = {process_inst: i for i, process_inst in enumerate(process_insts)}
+            _hists = {}
+            for process_inst in sorted(hists, key=process_order.__getitem__):
                 h = hists[process_inst]
                 # selections
                 h = h[{
@@ -631,6 +651,10 @@ class PlotCutflowVariablesBase(
             process_inst: [sub for sub, _, _ in process_inst.walk_processes(include_self=True)]
             for process_inst in process_insts
         }
+        sub_process_names = {
+            process_inst: {sub.name for sub in subs}
+            for process_inst, subs in sub_process_insts.items()
+        }
 
         # histogram data per process copy
         hists = {}
@@ -638,6 +662,7 @@ class PlotCutflowVariablesBase(
         with self.publish_step(f"plotting {self.branch_data.variable} in {category_inst.name}"):
             for dataset, inp in self.input().items():
                 dataset_inst = self.config_inst.get_dataset(dataset)
+                dataset_process_names = {p.name for p, _, _ in dataset_inst.walk_processes()}
                 h_in = inp["hists"][self.branch_data.variable].load(formatter="pickle")
 
                 # sanity checks
@@ -645,22 +670,21 @@ class PlotCutflowVariablesBase(
                 if n_shifts != 1:
                     raise Exception(f"shift axis is supposed to only contain 1 bin, found {n_shifts}")
 
+                # process ids present in the histogram, resolved once for fast membership checks
+                h_process_ids = set(h_in.axes["process"])
+
                 # loop and extract one histogram per process
                 for process_inst in process_insts:
                     # skip when the dataset is already known to not contain any sub process
-                    if not any(
-                        dataset_inst.has_process(sub_process_inst.name)
-                        for sub_process_inst in sub_process_insts[process_inst]
-                    ):
+                    if dataset_process_names.isdisjoint(sub_process_names[process_inst]):
                         continue
 
-                    # select processes and reduce axis
-                    h = h_in.copy()
-                    h = h[{
+                    # select processes and reduce axis, the selection already returns a new histogram
+                    h = h_in[{
                         "process": [
                             hist.loc(p.id)
                             for p in sub_process_insts[process_inst]
-                            if p.id in h.axes["process"]
+                            if p.id in h_process_ids
                         ],
                     }]
                     h = h[{"process": sum}]
@@ -676,8 +700,9 @@ class PlotCutflowVariablesBase(
                 raise Exception("no histograms found to plot")
 
             # axis selections and reductions, including sorting by process order
-            _hists = OrderedDict()
-            for process_inst in sorted(hists, key=process_insts.index):
+            process_order = {process_inst: i for i, process_inst in enumerate(process_insts)}
+            _hists = {}
+            for process_inst in sorted(hists, key=process_order.__getitem__):
                 h = hists[process_inst]
                 # selections
                 h = h[{
@@ -761,6 +786,12 @@ class PlotCutflowVariables1D(
         if len(variable_insts) != 1:
             raise Exception(f"task {self.task_family} is only viable for single variables")
 
+        # shallow copies of the category and variables, created once and shared by all plots since
+        # applying the variable settings to them is idempotent; processes are still copied per plot
+        # as process settings modify them cumulatively (e.g. appending scale factors to labels)
+        category_copy = category_inst.copy_shallow()
+        variable_copies = [var_inst.copy_shallow() for var_inst in variable_insts]
+
         outputs = self.output()["plots"]
         if self.per_plot == "processes":
             for step in self.chosen_steps:
@@ -774,8 +805,8 @@ class PlotCutflowVariables1D(
                     self.plot_function,
                     hists=step_hists,
                     config_inst=self.config_inst,
-                    category_inst=category_inst.copy_shallow(),
-                    variable_insts=[var_inst.copy_shallow() for var_inst in variable_insts],
+                    category_inst=category_copy,
+                    variable_insts=variable_copies,
                     style_config={"legend_cfg": {"title": f"Step '{step}'"}},
                     **self.get_plot_parameters(),
                 )
@@ -796,8 +827,8 @@ class PlotCutflowVariables1D(
                     self.plot_function,
                     hists=process_hists,
                     config_inst=self.config_inst,
-                    category_inst=category_inst.copy_shallow(),
-                    variable_insts=[var_inst.copy_shallow() for var_inst in variable_insts],
+                    category_inst=category_copy,
+                    variable_insts=variable_copies,
                     style_config={"legend_cfg": {"title": process_inst.label}},
                     **self.get_plot_parameters(),
                 )
@@ -834,6 +865,12 @@ class PlotCutflowVariables2D(
     def run_postprocess(self, hists, category_inst, variable_insts):
         import hist
 
+        # shallow copies of the category and variables, created once and shared by all plots since
+        # applying the variable settings to them is idempotent; processes are still copied per plot
+        # as process settings modify them cumulatively (e.g. appending scale factors to labels)
+        category_copy = category_inst.copy_shallow()
+        variable_copies = [var_inst.copy_shallow() for var_inst in variable_insts]
+
         outputs = self.output()["plots"]
 
         for step in self.chosen_steps:
@@ -847,8 +884,8 @@ class PlotCutflowVariables2D(
                 self.plot_function,
                 hists=step_hists,
                 config_inst=self.config_inst,
-                category_inst=category_inst.copy_shallow(),
-                variable_insts=[var_inst.copy_shallow() for var_inst in variable_insts],
+                category_inst=category_copy,
+                variable_insts=variable_copies,
                 style_config={"legend_cfg": {"title": f"Step '{step}'"}},
                 **self.get_plot_parameters(),
             )
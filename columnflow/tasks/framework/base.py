@@ -32,6 +32,10 @@ default_dataset = law.config.get_expanded("analysis", "default_dataset")
 # placeholder to denote a default value that is resolved dynamically
 RESOLVE_DEFAULT = "DEFAULT"
 
+# fixed pickle protocol for histogram outputs, so that their format does not depend on the writing
+# interpreter (protocol 5 requires python 3.8)
+HIST_PICKLE_PROTOCOL = 5
+
 
 class Requirements(DotDict):
     """General class for requirements of different tasks.
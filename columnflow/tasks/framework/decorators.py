@@ -2,6 +2,8 @@
 Custom law task method decorators.
 """
 
+from collections import deque
+
 import law
 from typing import Any, Callable
 
@@ -62,20 +64,23 @@ def view_output_plots(
 
         # collect all paths to view
         view_paths: list[str] = []
-        outputs: list[Any] = law.util.flatten(task.output())
+        seen_paths: set[str] = set()
+        outputs: deque[Any] = deque(law.util.flatten(task.output()))
         while outputs:
-            output = outputs.pop(0)
+            output = outputs.popleft()
             if isinstance(output, law.TargetCollection):
                 outputs.extend(output._flat_target_list)
                 continue
-            if not getattr(output, "path", None):
+            # resolve the path only once and skip non-plot outputs before any further checks
+            path = getattr(output, "path", None)
+            if not path or not path.endswith((".pdf", ".png")):
+                continue
+            if not isinstance(output, law.LocalTarget):
+                task.logger.warning(f"cannot show non-local plot at '{path}'")
                 continue
-            if output.path.endswith((".pdf", ".png")):
-                if not isinstance(output, law.LocalTarget):
-                    task.logger.warning(f"cannot show non-local plot at '{output.path}'")
-                    continue
-                elif output.path not in view_paths:
-                    view_paths.append(output.path)
+            if path not in seen_paths:
+                seen_paths.add(path)
+                view_paths.append(path)
 
         # loop through paths and view them
         for path in view_paths:
@@ -16,7 +16,7 @@ import law
 import order as od
 
 from columnflow.types import Sequence, Any, Iterable, Union
-from columnflow.tasks.framework.base import AnalysisTask, ConfigTask, RESOLVE_DEFAULT
+from columnflow.tasks.framework.base import AnalysisTask, ConfigTask, RESOLVE_DEFAULT, HIST_PICKLE_PROTOCOL
 from columnflow.tasks.framework.parameters import SettingsParameter
 from columnflow.calibration import Calibrator
 from columnflow.selection import Selector
@@ -2344,20 +2344,27 @@ class MergeHistogramMixin(
         inputs = self.input()["collection"]
         outputs = self.output()
 
-        # load input histograms
-        hists = [
-            inp["hists"].load(formatter="pickle")
-            for inp in self.iter_progress(inputs.targets.values(), len(inputs), reach=(0, 50))
-        ]
+        # load input histograms one at a time and accumulate them per variable, so that only a
+        # single input is held in memory next to the merged histograms
+        merged = {}
+        for inp in self.iter_progress(inputs.targets.values(), len(inputs), reach=(0, 90)):
+            hists = inp["hists"].load(formatter="pickle")
+            for variable_name, h in hists.items():
+                # freshly loaded histograms can be used as accumulators without copying
+                if variable_name in merged:
+                    merged[variable_name] += h
+                else:
+                    merged[variable_name] = h
+            del hists
 
         # create a separate file per output variable
-        variable_names = list(hists[0].keys())
-        for variable_name in self.iter_progress(variable_names, len(variable_names), reach=(50, 100)):
-            self.publish_message(f"merging histograms for '{variable_name}'")
-
-            variable_hists = [h[variable_name] for h in hists]
-            merged = sum(variable_hists[1:], variable_hists[0].copy())
-            outputs["hists"][variable_name].dump(merged, formatter="pickle")
+        for variable_name in self.iter_progress(list(merged), len(merged), reach=(90, 100)):
+            self.publish_message(f"writing merged histograms for '{variable_name}'")
+            outputs["hists"][variable_name].dump(
+                merged.pop(variable_name),
+                formatter="pickle",
+                protocol=HIST_PICKLE_PROTOCOL,
+            )
 
         # optionally remove inputs
         if self.remove_previous:
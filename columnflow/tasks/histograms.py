@@ -9,7 +9,9 @@ from __future__ import annotations
 # import luigi
 import law
 
-from columnflow.tasks.framework.base import Requirements, AnalysisTask, DatasetTask, wrapper_factory
+from columnflow.tasks.framework.base import (
+    Requirements, AnalysisTask, DatasetTask, wrapper_factory, HIST_PICKLE_PROTOCOL,
+)
 from columnflow.tasks.framework.mixins import (
     CalibratorsMixin, SelectorStepsMixin, ProducersMixin, MLModelsMixin, VariablesMixin,
     ShiftSourcesMixin, WeightProducerMixin, ChunkedIOMixin, MergeHistogramMixin,
@@ -133,6 +135,12 @@ class CreateHistograms(
         # get shift dependent aliases
         aliases = self.local_shift_inst.x("column_aliases", {})
 
+        # resolve variable instances once per variable tuple
+        variable_insts_per_key = {
+            var_key: [self.config_inst.get_variable(var_name) for var_name in var_names]
+            for var_key, var_names in self.variable_tuples.items()
+        }
+
         # define columns that need to be read
         read_columns = {Route("process_id")}
         read_columns |= set(map(Route, self.category_id_columns))
@@ -140,10 +148,7 @@ class CreateHistograms(
         read_columns |= set(map(Route, aliases.values()))
         read_columns |= {
             Route(inp)
-            for variable_inst in (
-                self.config_inst.get_variable(var_name)
-                for var_name in law.util.flatten(self.variable_tuples.values())
-            )
+            for variable_inst in law.util.flatten(list(variable_insts_per_key.values()))
             for inp in (
                 [variable_inst.expression]
                 if isinstance(variable_inst.expression, str)
@@ -152,6 +157,9 @@ class CreateHistograms(
             )
         }
 
+        # routes to columns containing category ids
+        category_id_routes = [Route(c) for c in sorted(self.category_id_columns)]
+
         # empty float array to use when input files have no entries
         empty_f32 = ak.Array(np.array([], dtype=np.float32))
 
@@ -193,11 +201,17 @@ class CreateHistograms(
                 else:
                     weight = ak.Array(np.ones(len(events), dtype=np.float32))
 
-                # define and fill histograms, taking into account multiple axes
-                for var_key, var_names in self.variable_tuples.items():
-                    # get variable instances
-                    variable_insts = [self.config_inst.get_variable(var_name) for var_name in var_names]
+                # merge category ids, only concatenating when there are multiple columns
+                if len(category_id_routes) == 1:
+                    category_ids = category_id_routes[0].apply(events)
+                else:
+                    category_ids = ak.concatenate([r.apply(events) for r in category_id_routes], axis=-1)
+
+                # shift ids are the same for all variables
+                shift_ids = np.full(len(events), self.global_shift_inst.id, dtype=np.int32)
 
+                # define and fill histograms, taking into account multiple axes
+                for var_key, variable_insts in variable_insts_per_key.items():
                     # create the histogram if not present yet
                     if var_key not in histograms:
                         h = (
@@ -216,17 +230,11 @@ class CreateHistograms(
                         # enable weights and store it
                         histograms[var_key] = h.Weight()
 
-                    # merge category ids
-                    category_ids = ak.concatenate(
-                        [Route(c).apply(events) for c in self.category_id_columns],
-                        axis=-1,
-                    )
-
                     # broadcast arrays so that each event can be filled for all its categories
                     fill_data = {
                         "category": category_ids,
                         "process": events.process_id,
-                        "shift": np.ones(len(events), dtype=np.int32) * self.global_shift_inst.id,
+                        "shift": shift_ids,
                         "weight": weight,
                     }
                     for variable_inst in variable_insts:
@@ -244,8 +252,8 @@ class CreateHistograms(
                     # fill it
                     fill_hist(histograms[var_key], fill_data)
 
-        # merge output files
-        self.output()["hists"].dump(histograms, formatter="pickle")
+        # merge output files, using the highest pickle protocol that writes storages without copies
+        self.output()["hists"].dump(histograms, formatter="pickle", protocol=HIST_PICKLE_PROTOCOL)
 
 
 # overwrite class defaults
@@ -356,15 +364,17 @@ class MergeShiftedHistograms(
         for variable_name, outp in self.iter_progress(outputs.items(), len(outputs)):
             self.publish_message(f"merging histograms for '{variable_name}'")
 
-            # load hists
-            variable_hists = [
-                coll["hists"].targets[variable_name].load(formatter="pickle")
-                for coll in inputs.values()
-            ]
+            # load hists one at a time and merge them in place into the first one
+            merged = None
+            for coll in inputs.values():
+                h = coll["hists"].targets[variable_name].load(formatter="pickle")
+                if merged is None:
+                    merged = h
+                else:
+                    merged += h
 
-            # merge and write the output
-            merged = sum(variable_hists[1:], variable_hists[0].copy())
-            outp.dump(merged, formatter="pickle")
+            # write the output
+            outp.dump(merged, formatter="pickle", protocol=HIST_PICKLE_PROTOCOL)
 
 
 MergeShiftedHistogramsWrapper = wrapper_factory(
@@ -102,6 +102,10 @@ class PlotVariablesBase(
             process_inst: [sub for sub, _, _ in process_inst.walk_processes(include_self=True)]
             for process_inst in process_insts
         }
+        sub_process_names = {
+            process_inst: {sub.name for sub in subs}
+            for process_inst, subs in sub_process_insts.items()
+        }
 
         # histogram data per process copy
         hists = {}
@@ -109,26 +113,40 @@ class PlotVariablesBase(
         with self.publish_step(f"plotting {self.branch_data.variable} in {category_inst.name}"):
             for dataset, inp in self.input().items():
                 dataset_inst = self.config_inst.get_dataset(dataset)
+                dataset_process_names = {p.name for p, _, _ in dataset_inst.walk_processes()}
+
+                # skip when the dataset is already known to not contain any sub process, before
+                # loading its histogram
+                dataset_process_insts = [
+                    process_inst
+                    for process_inst in process_insts
+                    if not dataset_process_names.isdisjoint(sub_process_names[process_inst])
+                ]
+                if not dataset_process_insts:
+                    continue
+
                 h_in = inp["collection"][0]["hists"].targets[self.branch_data.variable].load(formatter="pickle")
 
+                # process ids present in the histogram, resolved once for fast membership checks
+                h_process_ids = set(h_in.axes["process"])
+
+                # zeroed histogram for processes without entries, created once per dataset
+                h_empty = None
+
                 # loop and extract one histogram per process
-                for process_inst in process_insts:
-                    # skip when the dataset is already known to not contain any sub process
-                    if not any(
-                        dataset_inst.has_process(sub_process_inst.name)
-                        for sub_process_inst in sub_process_insts[process_inst]
-                    ):
+                for process_inst in dataset_process_insts:
+                    # when none of the sub processes is present in the histogram, still register an
+                    # empty histogram so that the process is plotted, but skip the selection
+                    process_ids = [p.id for p in sub_process_insts[process_inst] if p.id in h_process_ids]
+                    if not process_ids:
+                        if process_inst not in hists:
+                            if h_empty is None:
+                                h_empty = h_in[{"process": []}][{"process": sum}]
+                            hists[process_inst] = h_empty.copy()
                         continue
 
-                    # select processes and reduce axis
-                    h = h_in.copy()
-                    h = h[{
-                        "process": [
-                            hist.loc(p.id)
-                            for p in sub_process_insts[process_inst]
-                            if p.id in h.axes["process"]
-                        ],
-                    }]
+                    # select processes and reduce axis, the selection already returns a new histogram
+                    h = h_in[{"process": [hist.loc(process_id) for process_id in process_ids]}]
                     h = h[{"process": sum}]
 
                     # add the histogram
@@ -157,17 +175,19 @@ class PlotVariablesBase(
             _hists = OrderedDict()
             for process_inst in sorted(hists, key=process_insts.index):
                 h = hists[process_inst]
+                h_category_ids = set(h.axes["category"])
+                h_shift_ids = set(h.axes["shift"])
                 # selections
                 h = h[{
                     "category": [
                         hist.loc(c.id)
                         for c in leaf_category_insts
-                        if c.id in h.axes["category"]
+                        if c.id in h_category_ids
                     ],
                     "shift": [
                         hist.loc(s.id)
                         for s in plot_shifts
-                        if s.id in h.axes["shift"]
+                        if s.id in h_shift_ids
                     ],
                 }]
                 # reductions
@@ -40,23 +40,23 @@ def all_weights(self: WeightProducer, events: ak.Array, **kwargs) -> ak.Array:
             if not dataset_inst.has_tag("skip_pdf"):
                 dataset_inst.event_weights["pdf_weight"] = get_shifts_from_sources(config, "pdf")
     """
-    # build the full event weight
-    weight = ak.Array(np.ones(len(events)))
+    # build the full event weight, multiplying in place into a single buffer
+    weight = np.ones(len(events))
     if self.dataset_inst.is_mc and len(events):
         # multiply weights from global config `event_weights` aux entry
         for column in self.config_inst.x.event_weights:
-            weight = weight * Route(column).apply(events)
+            weight *= ak.to_numpy(Route(column).apply(events))
 
         # multiply weights from dataset-specific `event_weights` aux entry
         for column in self.dataset_inst.x("event_weights", []):
             if has_ak_column(events, column):
-                weight = weight * Route(column).apply(events)
+                weight *= ak.to_numpy(Route(column).apply(events))
             else:
                 self.logger.warning_once(
                     f"missing_dataset_weight_{column}",
                     f"weight '{column}' for dataset {self.dataset_inst.name} not found",
                 )
-    return events, weight
+    return events, ak.Array(weight)
 
 
 @all_weights.init
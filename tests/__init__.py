@@ -17,6 +17,7 @@ import columnflow as cf  # noqa
 # import all tests
 from .test_util import *
 from .test_columnar_util import *
+from .test_columnar_util_Ghent import *
 from .test_config_util import *
 from .test_task_parameters import *
 from .test_plotting import *
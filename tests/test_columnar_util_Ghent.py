@@ -0,0 +1,65 @@
+# coding: utf-8
+
+
+__all__ = ["SafeConcatenateTest"]
+
+import unittest
+
+from columnflow.util import maybe_import
+from columnflow.columnar_util_Ghent import safe_concatenate
+
+np = maybe_import("numpy")
+ak = maybe_import("awkward")
+
+
+class SafeConcatenateTest(unittest.TestCase):
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        # jagged arrays with three events each and varying numbers of entries per event
+        self.arrays = [
+            ak.Array([[float(i)] * (i % 3), [float(-i)], [float(i)] * (i % 5)])
+            for i in range(300)
+        ]
+
+    @staticmethod
+    def expected(arrays, axis=0):
+        # reference result built from python lists, as ak.concatenate itself is not reliable for
+        # large numbers of arrays
+        lists = [arr.to_list() for arr in arrays]
+        if axis == 0:
+            return sum(lists, [])
+        return [sum(entries, []) for entries in zip(*lists)]
+
+    def test_axis_0(self):
+        # SHOULD: concatenate more than 128 arrays along the event axis, preserving their order
+        result = safe_concatenate(self.arrays)
+        self.assertEqual(len(result), 3 * len(self.arrays))
+        self.assertEqual(result.to_list(), self.expected(self.arrays))
+
+        # forwarded keyword arguments
+        result = safe_concatenate(self.arrays, axis=0)
+        self.assertEqual(result.to_list(), self.expected(self.arrays, axis=0))
+
+    def test_axis_1(self):
+        # SHOULD: concatenate more than 128 arrays per event, preserving the order of the entries
+        result = safe_concatenate(self.arrays, axis=1)
+        self.assertEqual(len(result), 3)
+        self.assertEqual(result.to_list(), self.expected(self.arrays, axis=1))
+        self.assertEqual(ak.num(result, axis=1).to_list(), [300, 300, 600])
+
+    def test_batch_boundaries(self):
+        # SHOULD: handle array counts around the batch size of 128
+        for n in [1, 127, 128, 129, 256, 257]:
+            arrays = self.arrays[:n]
+            self.assertEqual(safe_concatenate(arrays).to_list(), self.expected(arrays))
+            self.assertEqual(safe_concatenate(arrays, axis=1).to_list(), self.expected(arrays, axis=1))
+
+    def test_many_arrays(self):
+        # SHOULD: concatenate over several batch levels (more than 128 * 128 arrays)
+        events = ak.Array([[i] for i in range(20000)])
+        arrays = [events[i:i + 1] for i in range(len(events))]
+        result = safe_concatenate(arrays)
+        self.assertEqual(len(result), 20000)
+        self.assertEqual(ak.flatten(result).to_list(), list(range(20000)))
@@ -2,7 +2,7 @@
 Test the plot_ml_evaluation module.
 """
 
-__all__ = ["TestPlotUtil", "TestPlotCM", "TestPlotROC"]
+__all__ = ["TestPlotUtil", "TestPlotCM", "TestPlotROC", "TestPlotConfig2D"]
 
 import io
 import unittest
@@ -334,3 +334,92 @@ class TestPlotROC(unittest.TestCase):
     def test_plot_roc_raises_value_error_for_invalid_evaluation_type(self):
         with self.assertRaises(ValueError), redirect_stdout(self.text_trap):
             self.plot_roc(self.events, self.config_inst, self.category_inst, evaluation_type="InvalidType")
+
+
+class TestPlotConfig2D(unittest.TestCase):
+
+    def setUp(self):
+        from columnflow.plotting.plot_util import prepare_plot_config_2d
+        self.prepare_plot_config_2d = prepare_plot_config_2d
+
+        # two dummy histograms with positive and negative entries, bin (1, 1) is empty in both
+        values = np.array([
+            [1.0, -2.0, 3.0],
+            [4.0, 0.0, 6.0],
+            [-7.0, 8.0, 9.0],
+            [10.0, 11.0, -12.0],
+        ])
+        self.hists = {}
+        for proc, scale in [("proc_1", 1.0), ("proc_2", 0.5)]:
+            h = hist.Hist.new.Reg(4, 0, 4, name="x").Reg(3, 0, 3, name="y").Weight()
+            h.view().value[...] = scale * values
+            h.view().variance[...] = np.abs(scale * values)
+            self.hists[proc] = h
+
+        # expected sum with the empty bin masked
+        self.values = 1.5 * values
+        self.values[1, 1] = np.nan
+
+    def get_zlim(self, config):
+        norm = config["kwargs"]["norm"]
+        return norm.vmin, norm.vmax
+
+    def test_masking(self):
+        config = self.prepare_plot_config_2d(self.hists)
+
+        # empty bins are masked, all other bins contain the sum of the inputs
+        np.testing.assert_array_equal(config["hist"].values(), self.values)
+
+        # the input histograms are unaffected
+        self.assertFalse(np.isnan(self.hists["proc_1"].values()).any())
+        self.assertEqual(self.hists["proc_1"].values()[1, 1], 0.0)
+
+        # the full z range is used by default
+        self.assertEqual(self.get_zlim(config), (-18.0, 16.5))
+        self.assertEqual(config["cbar_kwargs"]["extend"], "neither")
+
+    def test_zlim_specifiers(self):
+        for zlim, expected in [
+            (("min", "max"), (-18.0, 16.5)),
+            (("-maxabs", "maxabs"), (-18.0, 18.0)),
+            (("-minabs", "minabs"), (-16.5, 16.5)),
+            (("minabs", "maxabs"), (16.5, 18.0)),
+            ((-5.0, "max"), (-5.0, 16.5)),
+            (("min", lambda v: np.nanmedian(v)), (-18.0, 6.0)),
+        ]:
+            config = self.prepare_plot_config_2d(self.hists, zlim=zlim)
+            self.assertEqual(self.get_zlim(config), expected)
+
+        # callables receive the masked values of all bins
+        seen = []
+        self.prepare_plot_config_2d(self.hists, zlim=("min", lambda v: seen.append(v) or 1.0))
+        np.testing.assert_array_equal(seen[0], self.values)
+
+        # unknown specifiers raise
+        with self.assertRaises(ValueError):
+            self.prepare_plot_config_2d(self.hists, zlim=("min", "median"))
+
+    def test_extremes_hide(self):
+        config = self.prepare_plot_config_2d(self.hists, zlim=(-5.0, 10.0), extremes="hide")
+        expected = self.values.copy()
+        expected[(self.values < -5.0) | (self.values > 10.0)] = np.nan
+        np.testing.assert_array_equal(config["hist"].values(), expected)
+        self.assertEqual(self.get_zlim(config), (-5.0, 10.0))
+        self.assertEqual(config["cbar_kwargs"]["extend"], "neither")
+
+    def test_extremes_clip(self):
+        config = self.prepare_plot_config_2d(self.hists, zlim=(-5.0, 10.0), extremes="clip")
+        np.testing.assert_array_equal(config["hist"].values(), np.clip(self.values, -5.0, 10.0))
+        self.assertEqual(self.get_zlim(config), (-5.0, 10.0))
+        self.assertEqual(config["cbar_kwargs"]["extend"], "both")
+
+    def test_extend(self):
+        # the colorbar extension is derived from the unclipped value range
+        for zlim, extremes, extend in [
+            ((-20.0, 20.0), "clip", "neither"),
+            ((-5.0, 20.0), "clip", "min"),
+            ((-20.0, 10.0), "", "max"),
+            ((-5.0, 10.0), "color", "both"),
+        ]:
+            config = self.prepare_plot_config_2d(self.hists, zlim=zlim, extremes=extremes)
+            self.assertEqual(config["cbar_kwargs"]["extend"], extend)